@@ -4,7 +4,8 @@ import tkinter as tk
 from tkinter import messagebox, filedialog
 import abc
 import configparser
-from calculator import SimpleCalculator, AdvancedCalculator, SingleDigitOperations, TwoDigitOperations
+from calculator import SimpleCalculator, AdvancedCalculator, SingleDigitOperations, TwoDigitOperations, \
+    CalculatorEngine, format_float
 
 # Icon location
 ICON_FILE: str = "images/calculator.ico"
@@ -12,6 +13,10 @@ ICON_FILE: str = "images/calculator.ico"
 CONFIG_FILE: str = "configuration.txt"
 # Maximal number of digits that can be displayed
 MAX_NO_DIGITS = 15
+# Maximal number of results displayed when searching units and constants
+MAX_SEARCH_RESULTS = 50
+# Shift (in pixels) of every new window so windows don't cover each other
+WINDOW_OFFSET = 40
 
 # Various constants used across the code
 ZERO = '0'
@@ -22,18 +27,63 @@ ERROR_DISPLAY = 'Error'
 
 class App(tk.Tk):
     """
-    Class representing main tk instance. The point of this class is to easily change frames when necessary
+    Class representing main tk instance. It manages all the calculator windows
+    and holds the engine (memory and unit converter) shared between them
     """
 
     def __init__(self):
         super().__init__()
+        # Main tk instance is hidden, calculators are displayed in separate windows
+        self.withdraw()
+        self.engine = CalculatorEngine()
+        self.windows = []
+
+        self.settings = configparser.ConfigParser()
+        self.settings.read(CONFIG_FILE, 'utf-8')
+
+        self.open_window(SimpleCalculatorApp)
+
+    def open_window(self, frame_class):
+        window = CalculatorWindow(self)
+        # Configure location of the screen
+        x_location = int(self.settings['DEFAULT'].get("x_location", '531')) + WINDOW_OFFSET * len(self.windows)
+        y_location = int(self.settings['DEFAULT'].get("y_location", '227')) + WINDOW_OFFSET * len(self.windows)
+        window.geometry('+%d+%d' % (x_location, y_location))
+        window.switch_frame(frame_class)
+        self.windows.append(window)
+
+    def close_window(self, window):
+        self.windows.remove(window)
+        window.destroy()
+
+    # In contrast to typical calculator we will save user preferences about location
+    def finish(self, window):
+        self.settings["DEFAULT"]["X_LOCATION"] = str(window.winfo_x())
+        self.settings["DEFAULT"]["Y_LOCATION"] = str(window.winfo_y())
+        with open(CONFIG_FILE, 'w') as f:
+            self.settings.write(f)
+        self.destroy()
+
+
+class CalculatorWindow(tk.Toplevel):
+    """
+    Class representing single calculator window. The point of this class is to easily change frames when necessary
+    """
+
+    def __init__(self, app: App):
+        super().__init__(app)
+        self.app = app
+        self.engine = app.engine
         self.frame = None
-        self.switch_frame(SimpleCalculatorApp)
+        self.resizable(False, False)
 
     # Swap frames by creating a new frame and destroying the old frame
+    # Displayed number is kept so the calculation can be continued on the other calculator
     def switch_frame(self, frame_class):
         new_frame = frame_class(self)
         if self.frame is not None:
+            if self.frame.calculator.is_working:
+                new_frame.set_number(self.frame.number_line['text'])
             if self.frame.number_line is not None:
                 self.frame.number_line.destroy()
             self.frame.destroy()
@@ -47,19 +97,11 @@ class CalculatorApp(tk.Frame):
     This class also holds all the abstract methods of inheriting apps
     """
 
-    def __init__(self, parent: App):
+    def __init__(self, parent: CalculatorWindow):
         super().__init__(parent)
         self.parent = parent
         self.parent.iconbitmap(ICON_FILE)
-        self.parent.protocol("WM_DELETE_WINDOW", self.quit)
-
-        # Configure location of the screen
-        self.config = configparser.ConfigParser()
-        self.config.read(CONFIG_FILE, 'utf-8')
-        x_location = int(self.config['DEFAULT'].get("x_location", '531'))
-        y_location = int(self.config['DEFAULT'].get("y_location", '227'))
-        self.parent.geometry('+%d+%d' % (x_location, y_location))
-        self.parent.resizable(False, False)
+        self.parent.protocol("WM_DELETE_WINDOW", self.close)
 
         # Define calculator functionalities
         self.number_line = None
@@ -67,16 +109,18 @@ class CalculatorApp(tk.Frame):
         self.create_number_line()
         self.create_workspace()
 
-    # In contrast to typical calculator we will save user preferences about location
-    # We will also ask him for confirmation about ending the program
+    # Closing the last window ends the program
+    def close(self, event=None):
+        if len(self.parent.app.windows) > 1:
+            self.parent.app.close_window(self.parent)
+        else:
+            self.quit()
+
+    # We will ask the user for confirmation about ending the program
     def quit(self, event=None):
-        reply = messagebox.askyesno("End of work", "Finish?")
+        reply = messagebox.askyesno("End of work", "Finish?", parent=self.parent)
         if reply:
-            self.config["DEFAULT"]["X_LOCATION"] = str(self.parent.winfo_x())
-            self.config["DEFAULT"]["Y_LOCATION"] = str(self.parent.winfo_y())
-            with open(CONFIG_FILE, 'w') as f:
-                self.config.write(f)
-            self.parent.destroy()
+            self.parent.app.finish(self.parent)
 
     @abc.abstractmethod
     def create_menu(self):
@@ -92,10 +136,10 @@ class CalculatorApp(tk.Frame):
 
 
 class SimpleCalculatorApp(CalculatorApp):
-    def __init__(self, parent: App):
+    def __init__(self, parent: CalculatorWindow):
         super().__init__(parent)
         self.parent.title("Simple calculator")
-        self.calculator = SimpleCalculator()
+        self.calculator = self.parent.engine.create_calculator(SimpleCalculator)
         # If the user performs any operation that requires two numbers (like +, - etc.)
         # Than the new digit will always replace the current number
         self.is_input_new_number = False
@@ -109,14 +153,24 @@ class SimpleCalculatorApp(CalculatorApp):
             ("Simple calculator", lambda: self.parent.switch_frame(SimpleCalculatorApp)),
             ("Advanced calculator", lambda: self.parent.switch_frame(AdvancedCalculatorApp)),
         )
+        # All windows share the memory so it's possible to use the result from one calculator in the other
+        window_options = (
+            ("New simple calculator", lambda: self.parent.app.open_window(SimpleCalculatorApp)),
+            ("New advanced calculator", lambda: self.parent.app.open_window(AdvancedCalculatorApp)),
+        )
         options_quit = (
+            ("Close window", self.close, "Ctrl+W", "<Control-w>"),
             ("Quit", self.quit, "Ctrl+Q", "<Control-q>"),
         )
 
         menubar = tk.Menu(self.parent)
+        self.menubar = menubar
         file_menu = tk.Menu(menubar, tearoff=0)
         for label, command in calculator_options:
             file_menu.add_command(label=label, underline=0, command=command)
+        file_menu.add_separator()
+        for label, command in window_options:
+            file_menu.add_command(label=label, underline=0, command=command)
 
         quit_menu = tk.Menu(menubar, tearoff=0)
         for label, command, shortcut_text, shortcut in options_quit:
@@ -132,7 +186,7 @@ class SimpleCalculatorApp(CalculatorApp):
         Number line shows the user the number that he has inputed
         """
 
-        self.number_line = tk.Label(text='0', relief=tk.RIDGE, height=2, anchor='e', padx=10,
+        self.number_line = tk.Label(self.parent, text='0', relief=tk.RIDGE, height=2, anchor='e', padx=10,
                                     font='Helvetica 36 bold')
         self.number_line.pack(fill='x')
 
@@ -336,10 +390,39 @@ class SimpleCalculatorApp(CalculatorApp):
 
 
 class AdvancedCalculatorApp(SimpleCalculatorApp):
-    def __init__(self, parent: App):
+    def __init__(self, parent: CalculatorWindow):
         super().__init__(parent)
         self.parent.title("Advanced calculator")
-        self.calculator = AdvancedCalculator()
+        self.calculator = self.parent.engine.create_calculator(AdvancedCalculator)
+
+    # Advanced calculator additionally allows to convert units and to search for constants
+    def create_menu(self):
+        super().create_menu()
+
+        tools_options = (
+            ("Unit conversion", lambda: UnitConversionWindow(self)),
+            ("Constants", lambda: ConstantsWindow(self)),
+        )
+        tools_menu = tk.Menu(self.menubar, tearoff=0)
+        for label, command in tools_options:
+            tools_menu.add_command(label=label, underline=0, command=command)
+        # Menubar has a tearoff entry at index 0 so the position is taken from the Quit menu
+        self.menubar.insert_cascade(self.menubar.index("Quit"), label="Tools", menu=tools_menu)
+
+    # Constant replaces the displayed number like a result of an operation so it cannot be edited
+    def insert_constant(self, name):
+        if self.calculator.is_working:
+            self.set_number(format_float(self.calculator.converter.constant(name)))
+            self.is_input_new_number = True
+
+    def insert_random(self):
+        if self.calculator.is_working:
+            self.set_number(format_float(random.random()))
+            self.is_input_new_number = True
+
+    # Converted value replaces the displayed number so it can be used in further operations
+    def convert_number(self, from_unit, to_unit):
+        self.perform_one_digit_operation(SingleDigitOperations.CONVERT, (from_unit, to_unit))
 
     # This workspace will have more buttons packed that simple calculator
     def create_workspace(self):
@@ -370,11 +453,11 @@ class AdvancedCalculatorApp(SimpleCalculatorApp):
         tk.Button(buttons_lane2, text='n!', width=9, height=2, font='bold', command=lambda:
         self.perform_one_digit_operation(SingleDigitOperations.FACTORIAL)).pack(side=tk.LEFT)
         tk.Button(buttons_lane2, text='\u03C0', width=9, height=2, font='bold', command=lambda:
-        self.set_number(str(math.pi))).pack(side=tk.LEFT)
+        self.insert_constant('pi')).pack(side=tk.LEFT)
         tk.Button(buttons_lane2, text='e', width=9, height=2, font='bold', command=lambda:
-        self.set_number(str(math.e))).pack(side=tk.LEFT)
+        self.insert_constant('e')).pack(side=tk.LEFT)
         tk.Button(buttons_lane2, text='rand', width=9, height=2, font='bold', command=lambda:
-        self.set_number(str(random.random()))).pack(side=tk.LEFT)
+        self.insert_random()).pack(side=tk.LEFT)
         buttons_lane2.pack()
 
         buttons_lane3 = tk.Frame(workspace)
@@ -453,3 +536,123 @@ class AdvancedCalculatorApp(SimpleCalculatorApp):
         buttons_lane7.pack()
 
         workspace.pack()
+
+
+class SearchWindow(tk.Toplevel):
+    """
+    Window that allows to search units or constants as the user types
+    Results are taken from the prefix index of the calculator converter
+    """
+
+    def __init__(self, app: AdvancedCalculatorApp):
+        # The window is bound to the calculator frame so it's closed together with it
+        super().__init__(app)
+        self.app = app
+        self.converter = app.calculator.converter
+        self.resizable(False, False)
+        self.found = []
+
+        self.search = tk.StringVar()
+        self.search.trace_add('write', lambda *args: self.refresh())
+        search_line = tk.Entry(self, textvariable=self.search, font='Helvetica 14')
+        search_line.pack(fill='x')
+        search_line.focus_set()
+        self.results = tk.Listbox(self, width=50, height=12)
+        self.results.pack(fill='x')
+        self.create_workspace()
+        self.refresh()
+
+    def refresh(self):
+        self.found = self.find(self.search.get())
+        self.results.delete(0, tk.END)
+        for key in self.found:
+            self.results.insert(tk.END, self.describe(key))
+
+    def selected(self):
+        selection = self.results.curselection()
+        if len(selection) == 0:
+            return None
+        return self.found[selection[0]]
+
+    @abc.abstractmethod
+    def create_workspace(self):
+        pass
+
+    @abc.abstractmethod
+    def find(self, prefix):
+        pass
+
+    @abc.abstractmethod
+    def describe(self, key):
+        pass
+
+
+class UnitConversionWindow(SearchWindow):
+    def __init__(self, app: AdvancedCalculatorApp):
+        self.from_unit = None
+        self.to_unit = None
+        super().__init__(app)
+        self.title("Unit conversion")
+
+    def create_workspace(self):
+        self.conversion_line = tk.Label(self, text='', relief=tk.RIDGE, height=2, font='bold')
+        self.conversion_line.pack(fill='x')
+
+        workspace = tk.Frame(self)
+        tk.Button(workspace, text='From', width=12, height=1, command=lambda:
+        self.set_from_unit()).pack(side=tk.LEFT)
+        tk.Button(workspace, text='To', width=12, height=1, command=lambda:
+        self.set_to_unit()).pack(side=tk.LEFT)
+        tk.Button(workspace, text='Convert', width=12, height=1, background='light blue', command=lambda:
+        self.convert()).pack(side=tk.LEFT)
+        workspace.pack()
+        self.update_conversion_line()
+
+    def find(self, prefix):
+        return self.converter.search_units(prefix, MAX_SEARCH_RESULTS)
+
+    def describe(self, key):
+        unit = self.converter.unit(key)
+        return f'{unit.symbol} - {unit.name} ({unit.category.value})'
+
+    def update_conversion_line(self):
+        self.conversion_line['text'] = f'{self.from_unit or "?"} \u2192 {self.to_unit or "?"}'
+
+    def set_from_unit(self):
+        if self.selected() is not None:
+            self.from_unit = self.selected()
+            self.update_conversion_line()
+
+    def set_to_unit(self):
+        if self.selected() is not None:
+            self.to_unit = self.selected()
+            self.update_conversion_line()
+
+    def convert(self):
+        if self.from_unit is None or self.to_unit is None:
+            return
+        if self.converter.unit(self.from_unit).category != self.converter.unit(self.to_unit).category:
+            messagebox.showwarning("Incompatible units", "Units must measure the same quantity", parent=self)
+            return
+        self.app.convert_number(self.from_unit, self.to_unit)
+
+
+class ConstantsWindow(SearchWindow):
+    def __init__(self, app: AdvancedCalculatorApp):
+        super().__init__(app)
+        self.title("Constants")
+        self.results.bind('<Double-Button-1>', lambda event: self.insert())
+
+    def create_workspace(self):
+        tk.Button(self, text='Insert', width=12, height=1, background='light blue', command=lambda:
+        self.insert()).pack()
+
+    def find(self, prefix):
+        return self.converter.search_constants(prefix, MAX_SEARCH_RESULTS)
+
+    def describe(self, key):
+        return f'{key} = {format_float(self.converter.constant(key))}'
+
+    def insert(self):
+        if self.selected() is not None:
+            self.app.insert_constant(self.selected())
@@ -1,2 +1,4 @@
-from calculator.calculator import SimpleCalculator, AdvancedCalculator
-from calculator.utils import SingleDigitOperations, TwoDigitOperations
+from calculator.calculator import SimpleCalculator, AdvancedCalculator, MemoryRegister, format_float
+from calculator.utils import SingleDigitOperations, TwoDigitOperations, UnitCategories
+from calculator.converter import UnitConverter
+from calculator.engine import CalculatorEngine
@@ -1,5 +1,33 @@
 import math
+from decimal import Decimal
 from calculator.utils import SingleDigitOperations, TwoDigitOperations
+from calculator.converter import UnitConverter
+
+# Largest number whose factorial can be represented as float
+MAX_FACTORIAL = 170
+
+
+# Shortest fixed point representation of the float (98.6 instead of 98.599999999999994315...)
+def format_float(number: float):
+    return format(Decimal(repr(number)), 'f')
+
+
+class MemoryRegister:
+    """
+    Memory of the calculator (MC, MR, M+, M-). One register can be shared by many calculators
+    """
+
+    def __init__(self):
+        self.value: float = 0
+
+    def add(self, number: float):
+        self.value += number
+
+    def subtract(self, number: float):
+        self.value -= number
+
+    def clear(self):
+        self.value = 0
 
 
 class SimpleCalculator:
@@ -8,9 +36,9 @@ class SimpleCalculator:
     Used for simple calculator app
     """
 
-    def __init__(self):
+    def __init__(self, memory: MemoryRegister = None):
         self._number: float = 0
-        self._memory: float = 0
+        self._memory = memory if memory is not None else MemoryRegister()
         self._operation = None
 
     @property
@@ -20,7 +48,7 @@ class SimpleCalculator:
         elif int(self._number) == self._number:
             return str(int(self._number))
         else:
-            return f'{self._number:.30f}'
+            return format_float(self._number)
 
     @number.setter
     def number(self, number):
@@ -28,14 +56,14 @@ class SimpleCalculator:
 
     @property
     def memory(self):
-        if int(self._memory) == self._memory:
-            return str(int(self._memory))
+        if int(self._memory.value) == self._memory.value:
+            return str(int(self._memory.value))
         else:
-            return f'{self._memory:.30f}'
+            return format_float(self._memory.value)
 
     @memory.setter
     def memory(self, memory):
-        self._memory = memory
+        self._memory.value = memory
 
     @property
     def operation(self):
@@ -105,15 +133,15 @@ class SimpleCalculator:
 
     # M+ operation
     def add_memory(self, number: float):
-        self._memory += number
+        self._memory.add(number)
 
     # M- operation
     def subtract_memory(self, number: float):
-        self._memory -= number
+        self._memory.subtract(number)
 
     # MC operation
     def clear_memory(self):
-        self._memory = 0
+        self._memory.clear()
 
     # If the operation results in an error than the calculator is turned off
     # and no operations can be made (excluding clearing memory) until restart
@@ -130,8 +158,9 @@ class SimpleCalculator:
 
 
 class AdvancedCalculator(SimpleCalculator):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, memory: MemoryRegister = None, converter: UnitConverter = None):
+        super().__init__(memory)
+        self.converter = converter if converter is not None else UnitConverter()
 
     def calculate_one_digit_operation(self, number, operation: SingleDigitOperations, condition_number):
         if operation == SingleDigitOperations.FLOOR:
@@ -146,6 +175,9 @@ class AdvancedCalculator(SimpleCalculator):
             self.power_given_value(condition_number, number)
         elif operation == SingleDigitOperations.LOG:
             self.log_given_value(number, condition_number)
+        # For conversion the condition number is a pair of unit symbols (from, to)
+        elif operation == SingleDigitOperations.CONVERT:
+            self.convert(number, *condition_number)
         else:
             super().calculate_one_digit_operation(number, operation, condition_number)
 
@@ -171,10 +203,12 @@ class AdvancedCalculator(SimpleCalculator):
         self._number = abs(number)
 
     def factorial(self, number):
-        try:
-            self._number = math.factorial(number)
-        except ValueError:
+        # Factorial is defined only for non-negative integers
+        # and results above 170! don't fit into float so they cannot be used in further operations
+        if int(number) != number or not 0 <= number <= MAX_FACTORIAL:
             self._number = None
+        else:
+            self._number = math.factorial(int(number))
 
     def modulo(self, number):
         if number == 0:
@@ -196,3 +230,6 @@ class AdvancedCalculator(SimpleCalculator):
 
     def log(self, log):
         self.log_given_value(self._number, log)
+
+    def convert(self, number, from_unit, to_unit):
+        self._number = self.converter.convert(number, from_unit, to_unit)
@@ -0,0 +1,223 @@
+import math
+import configparser
+from typing import NamedTuple
+from calculator.utils import UnitCategories
+
+# Local file with currency exchange rates (amount of given currency for one unit of base currency)
+RATES_FILE: str = "data/currency_rates.txt"
+RATES_SECTION: str = "RATES"
+BASE_CURRENCY: str = "USD"
+# Number of significant digits of the conversion result
+SIGNIFICANT_DIGITS = 15
+# Temperatures are rounded to this number of decimal places, smaller differences come from the floating point error
+TEMPERATURE_DECIMALS = 9
+
+# SI and binary prefixes (symbol: (name, factor)) - they are combined with base units to create prefixed units
+PREFIXES = {
+    "f": ("femto", 1e-15), "p": ("pico", 1e-12), "n": ("nano", 1e-9), "µ": ("micro", 1e-6),
+    "m": ("milli", 1e-3), "c": ("centi", 1e-2), "d": ("deci", 1e-1), "k": ("kilo", 1e3),
+    "M": ("mega", 1e6), "G": ("giga", 1e9), "T": ("tera", 1e12), "P": ("peta", 1e15), "E": ("exa", 1e18),
+    "Ki": ("kibi", 2 ** 10), "Mi": ("mebi", 2 ** 20), "Gi": ("gibi", 2 ** 30), "Ti": ("tebi", 2 ** 40),
+    "Pi": ("pebi", 2 ** 50), "Ei": ("exbi", 2 ** 60),
+}
+# Keyboard friendly alias of the micro sign used when indexing units
+MICRO_SIGN = "µ"
+MICRO_ALIAS = "u"
+
+# Units that accept prefixes (symbol, name, factor to the base unit of the category, prefixes in common use)
+PREFIXED_UNITS = {
+    UnitCategories.LENGTH: (("m", "metre", 1, ("f", "p", "n", "µ", "m", "c", "d", "k")),),
+    UnitCategories.MASS: (("g", "gram", 1e-3, ("n", "µ", "m", "k")), ("t", "tonne", 1e3, ("k", "M", "G"))),
+    UnitCategories.DATA: (
+        ("b", "bit", 1 / 8, ("k", "M", "G", "T")),
+        ("B", "byte", 1, ("k", "M", "G", "T", "P", "E", "Ki", "Mi", "Gi", "Ti", "Pi", "Ei")),
+    ),
+}
+# Units without prefixes (symbol, name, factor to the base unit of the category)
+PLAIN_UNITS = {
+    UnitCategories.LENGTH: (
+        ("in", "inch", 0.0254), ("ft", "foot", 0.3048), ("yd", "yard", 0.9144), ("mi", "mile", 1609.344),
+        ("nmi", "nautical mile", 1852), ("Å", "angstrom", 1e-10), ("au", "astronomical unit", 149597870700),
+        ("ly", "light year", 9460730472580800), ("pc", "parsec", 3.0856775814913673e16),
+    ),
+    UnitCategories.MASS: (
+        ("oz", "ounce", 0.028349523125), ("lb", "pound", 0.45359237), ("st", "stone", 6.35029318),
+        ("ct", "carat", 2e-4), ("Da", "dalton", 1.66053906660e-27),
+    ),
+}
+# Temperature scales (symbol, name, scale, offset) where kelvin = value * scale + offset
+TEMPERATURE_UNITS = (
+    ("K", "kelvin", 1, 0), ("°C", "celsius", 1, 273.15),
+    ("°F", "fahrenheit", 5 / 9, 273.15 - 32 * 5 / 9), ("°R", "rankine", 5 / 9, 0),
+)
+
+# Constants that can be inserted into the calculator (name, symbol, value)
+# Only constants that fit into the 15 digit fixed point display are included
+CONSTANTS = (
+    ("pi", "π", math.pi), ("e", "e", math.e), ("tau", "τ", math.tau),
+    ("golden ratio", "φ", (1 + math.sqrt(5)) / 2), ("square root of 2", "√2", math.sqrt(2)),
+    ("speed of light", "c", 299792458), ("gravitational acceleration", "g", 9.80665),
+)
+
+
+class Unit(NamedTuple):
+    """
+    Single unit with the values needed to convert it to the base unit of its category
+    (base value = value * scale + offset)
+    """
+    symbol: str
+    name: str
+    category: UnitCategories
+    scale: float
+    offset: float = 0
+
+
+class PrefixTrie:
+    """
+    Prefix tree used to search units and constants as the user types
+    Keys are case insensitive. Values are returned depth-first: the value of the key equal to the prefix comes first,
+    then keys branching off it in order in which their next characters were first inserted
+    (search for "k" gives K, km, kg... even though kelvin was inserted after the kilo units)
+    """
+
+    def __init__(self):
+        self._children = {}
+        self._values = []
+
+    def insert(self, key: str, value):
+        node = self
+        for char in key.lower():
+            node = node._children.setdefault(char, PrefixTrie())
+        if value not in node._values:
+            node._values.append(value)
+
+    def search(self, prefix: str, limit=None):
+        """
+        Return values of all the keys starting with the given prefix (without duplicates)
+        """
+
+        node = self
+        for char in prefix.lower():
+            node = node._children.get(char)
+            if node is None:
+                return []
+
+        found = {}
+        stack = [node]
+        while stack and (limit is None or len(found) < limit):
+            node = stack.pop()
+            for value in node._values:
+                found.setdefault(value)
+            stack.extend(reversed(node._children.values()))
+        return list(found)[:limit]
+
+
+class UnitConverter:
+    """
+    Class to convert values between units of the same category and to look up constants
+    Every unit is stored in the precomputed table together with its factor to the base unit of the category
+    so the conversion never has to walk through the intermediate units
+    """
+
+    def __init__(self, rates_file: str = RATES_FILE):
+        self._units = {}
+        self._constants = {}
+        self._unit_index = PrefixTrie()
+        self._constant_index = PrefixTrie()
+
+        for category, units in PLAIN_UNITS.items():
+            for symbol, name, factor in units:
+                self._add_unit(Unit(symbol, name, category, factor))
+        for category, units in PREFIXED_UNITS.items():
+            for symbol, name, factor, prefixes in units:
+                self._add_unit(Unit(symbol, name, category, factor))
+                for prefix_symbol in prefixes:
+                    prefix_name, prefix_factor = PREFIXES[prefix_symbol]
+                    self._add_unit(Unit(prefix_symbol + symbol, prefix_name + name, category, prefix_factor * factor))
+        for symbol, name, scale, offset in TEMPERATURE_UNITS:
+            self._add_unit(Unit(symbol, name, UnitCategories.TEMPERATURE, scale, offset))
+        self.load_rates(rates_file)
+
+        for name, symbol, value in CONSTANTS:
+            self._constants[name] = value
+            self._constant_index.insert(name, name)
+            self._constant_index.insert(symbol, name)
+
+    def _add_unit(self, unit: Unit):
+        # Symbols are case sensitive (mm and Mm are different units)
+        # If a prefixed symbol clashes with a common unit the common unit is kept
+        if unit.symbol in self._units:
+            return
+        self._units[unit.symbol] = unit
+        self._unit_index.insert(unit.symbol, unit.symbol)
+        self._unit_index.insert(unit.name, unit.symbol)
+        if MICRO_SIGN in unit.symbol:
+            self._unit_index.insert(unit.symbol.replace(MICRO_SIGN, MICRO_ALIAS), unit.symbol)
+
+    def load_rates(self, rates_file: str):
+        """
+        Load currency exchange rates from the local file. Missing file leaves only the base currency
+        """
+
+        rates = configparser.ConfigParser()
+        # Currency codes are case sensitive
+        rates.optionxform = str
+        rates.read(rates_file, 'utf-8')
+        self._add_unit(Unit(BASE_CURRENCY, BASE_CURRENCY, UnitCategories.CURRENCY, 1))
+        if rates.has_section(RATES_SECTION):
+            for symbol, rate in rates[RATES_SECTION].items():
+                try:
+                    rate = float(rate)
+                except ValueError:
+                    continue
+                existing = self._units.get(symbol)
+                if rate > 0 and (existing is None or existing.category == UnitCategories.CURRENCY):
+                    # Reloaded rates replace the previous ones
+                    self._units.pop(symbol, None)
+                    self._add_unit(Unit(symbol, symbol, UnitCategories.CURRENCY, 1 / rate))
+
+    @property
+    def units(self):
+        return list(self._units)
+
+    @property
+    def constants(self):
+        return list(self._constants)
+
+    def unit(self, symbol: str):
+        return self._units.get(symbol)
+
+    def units_in_category(self, category: UnitCategories):
+        return [symbol for symbol, unit in self._units.items() if unit.category == category]
+
+    def search_units(self, prefix: str, limit=None):
+        return self._unit_index.search(prefix, limit)
+
+    def search_constants(self, prefix: str, limit=None):
+        return self._constant_index.search(prefix, limit)
+
+    def constant(self, name: str):
+        return self._constants.get(name)
+
+    def convert(self, value: float, from_symbol: str, to_symbol: str):
+        """
+        Convert the value between two units
+        None is returned if units are unknown, from different categories or the temperature is below absolute zero
+        """
+
+        from_unit = self._units.get(from_symbol)
+        to_unit = self._units.get(to_symbol)
+        if from_unit is None or to_unit is None or from_unit.category != to_unit.category:
+            return None
+        if from_unit.category == UnitCategories.TEMPERATURE:
+            kelvin = round(value * from_unit.scale + from_unit.offset, TEMPERATURE_DECIMALS)
+            # Temperatures below absolute zero don't exist
+            if kelvin < 0:
+                return None
+            result = round((kelvin - to_unit.offset) / to_unit.scale, TEMPERATURE_DECIMALS)
+        else:
+            result = value * (from_unit.scale / to_unit.scale)
+        if not math.isfinite(result):
+            return None
+        # Remove the floating point error of going through the base unit (100 °C is 212 °F, not 211.999...)
+        return float(f'{result:.{SIGNIFICANT_DIGITS}g}')
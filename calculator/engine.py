@@ -0,0 +1,18 @@
+from calculator.calculator import MemoryRegister, AdvancedCalculator
+from calculator.converter import UnitConverter
+
+
+class CalculatorEngine:
+    """
+    Engine shared by all calculator windows
+    It holds the memory register and the unit converter used by every calculator
+    """
+
+    def __init__(self):
+        self.memory = MemoryRegister()
+        self.converter = UnitConverter()
+
+    def create_calculator(self, calculator_class):
+        if issubclass(calculator_class, AdvancedCalculator):
+            return calculator_class(self.memory, self.converter)
+        return calculator_class(self.memory)
@@ -14,6 +14,7 @@ class SingleDigitOperations(Enum):
     FACTORIAL = "n!"
     TOPOWER = "a^x"
     LOG = "logarithm"
+    CONVERT = "conversion"
 
 
 class TwoDigitOperations(Enum):
@@ -28,3 +29,14 @@ class TwoDigitOperations(Enum):
     EXPONENTATION = "x^y"
     ROOT = "root(x) of y"
     LOG = "logarithm"
+
+
+class UnitCategories(Enum):
+    """
+    Enum representing all categories of units that can be converted between each other
+    """
+    LENGTH = "length"
+    MASS = "mass"
+    TEMPERATURE = "temperature"
+    DATA = "data size"
+    CURRENCY = "currency"